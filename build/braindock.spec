@@ -126,6 +126,9 @@ hiddenimports = [
     # Environment
     'dotenv',
     
+    # Blocklist matching (imported optionally, so list it explicitly)
+    'ahocorasick',
+    
     # Standard library that might be missed
     'json',
     'logging',
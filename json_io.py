@@ -0,0 +1,40 @@
+"""
+JSON file serialization shared by the settings and license stores.
+
+Files are read and written as bytes. Output is the stdlib encoder's
+2-space indented, ASCII-escaped JSON - the same bytes earlier releases
+wrote in text mode, so those releases can still read these files
+whatever their locale encoding.
+"""
+
+import json
+from typing import Any
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to 2-space indented JSON.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        ASCII-only JSON, ready to write to a file opened in binary mode
+    """
+    return json.dumps(obj, indent=2).encode()
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON read from a file opened in binary mode.
+    
+    Args:
+        data: UTF-8 encoded JSON
+    
+    Returns:
+        Parsed object
+    
+    Raises:
+        json.JSONDecodeError: If the data isn't valid JSON
+    """
+    return json.loads(data)
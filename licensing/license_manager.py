@@ -8,14 +8,42 @@ Supports Stripe payments as the activation method.
 import json
 import hashlib
 import logging
+import os
+import tempfile
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from json_io import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
 
+def _checksum_json_sha256(data: Dict[str, Any]) -> str:
+    """
+    SHA256 of the key-sorted JSON encoding (original license format).
+    
+    Always uses the stdlib encoder - the checksum depends on its exact output.
+    """
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+# Checksum functions, keyed by the name stored in the file's
+# "checksum_algo" field. Files written before the field existed have no
+# marker and use the original JSON format.
+# hashlib's SHA256 is OpenSSL-backed and uses the CPU's SHA extensions
+# where available.
+_CHECKSUM_FUNCS = {
+    "sha256": _checksum_json_sha256,
+}
+_LEGACY_CHECKSUM_ALGO = "sha256"
+# Earlier releases hash every non-checksum key as JSON (marker included),
+# so they verify files written in this format and a rollback doesn't show
+# licensed users as tampered.
+_DEFAULT_CHECKSUM_ALGO = "sha256"
+
+
 def _get_machine_id() -> str:
     """
     Generate a unique machine identifier for license binding.
@@ -101,8 +129,23 @@ class LicenseManager:
             license_file: Path to the license data JSON file.
         """
         self.license_file = license_file
-        self.data = self._load_data()
-        
+        # Loaded from disk on first access to self.data
+        self._data: Optional[Dict[str, Any]] = None
+        # Parsed "activated_at" - reset whenever self.data is replaced
+        self._activated_cache: Optional[datetime] = None
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        """License data, loaded lazily so construction does no file I/O."""
+        if self._data is None:
+            self._data = self._load_data()
+        return self._data
+    
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = value
+        self._activated_cache = None
+    
     def _load_data(self) -> Dict[str, Any]:
         """
         Load license data from JSON file.
@@ -110,18 +153,19 @@ class LicenseManager:
         Returns:
             Dict containing license data.
         """
-        if self.license_file.exists():
-            try:
-                with open(self.license_file, 'r') as f:
-                    data = json.load(f)
-                    # Verify checksum if present
-                    if not self._verify_checksum(data):
-                        logger.warning("License file checksum mismatch - possible tampering")
-                        return self._default_data()
-                    logger.debug(f"Loaded license data: licensed={data.get('licensed', False)}")
-                    return data
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load license data: {e}")
+        try:
+            with open(self.license_file, 'rb') as f:
+                data = json_loads(f.read())
+                # Verify checksum if present
+                if not self._verify_checksum(data):
+                    logger.warning("License file checksum mismatch - possible tampering")
+                    return self._default_data()
+                logger.debug(f"Loaded license data: licensed={data.get('licensed', False)}")
+                return data
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load license data: {e}")
         
         return self._default_data()
     
@@ -142,19 +186,28 @@ class LicenseManager:
         """
         Calculate checksum for license data integrity.
         
-        Uses full SHA256 hash (not truncated) for security.
+        Uses the full hash (not truncated) for security. The algorithm is
+        taken from the data's "checksum_algo" field (the original JSON
+        format if absent).
         
         Args:
             data: License data dictionary.
             
         Returns:
-            Full SHA256 checksum string (64 characters).
+            Full checksum hex string (64 characters).
+            
+        Raises:
+            ValueError: If the data names an unknown checksum algorithm.
         """
+        algo = data.get("checksum_algo") or _LEGACY_CHECKSUM_ALGO
+        # Hand-edited files may hold any JSON value here, including
+        # unhashable ones like lists
+        checksum_func = _CHECKSUM_FUNCS.get(algo) if isinstance(algo, str) else None
+        if checksum_func is None:
+            raise ValueError(f"Unknown checksum algorithm: {algo!r}")
         # Create a copy without the checksum field
         data_copy = {k: v for k, v in data.items() if k != "checksum"}
-        # Sort keys for consistent hashing
-        data_str = json.dumps(data_copy, sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()  # Full hash, not truncated
+        return checksum_func(data_copy)  # Full hash, not truncated
     
     def _verify_checksum(self, data: Dict[str, Any]) -> bool:
         """
@@ -183,7 +236,11 @@ class LicenseManager:
             return True  # Unlicensed data doesn't need checksum
         
         # Verify checksum (support both old truncated and new full checksums)
-        calculated = self._calculate_checksum(data)
+        try:
+            calculated = self._calculate_checksum(data)
+        except ValueError as e:
+            logger.warning(f"License checksum not verifiable - {e}")
+            return False
         # Old format used 16-char truncated hash, new format uses full 64-char hash
         if stored_checksum != calculated and stored_checksum != calculated[:16]:
             logger.warning("License checksum mismatch - possible tampering")
@@ -200,16 +257,42 @@ class LicenseManager:
         return True
     
     def _save_data(self) -> None:
-        """Save license data to JSON file with checksum."""
+        """
+        Save license data to JSON file with checksum.
+        
+        Uses atomic write (write to temp file, then rename) so an interrupted
+        save can't leave a truncated file that would load as unlicensed.
+        """
         try:
             # Ensure parent directory exists
             self.license_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Add checksum before saving
+            # Add checksum before saving (algorithm marker is covered by it)
+            self.data["checksum_algo"] = _DEFAULT_CHECKSUM_ALGO
             self.data["checksum"] = self._calculate_checksum(self.data)
             
-            with open(self.license_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            # Write to a temp file in the same directory first (for atomic rename)
+            temp_fd, temp_path = tempfile.mkstemp(
+                suffix='.tmp',
+                prefix='license_',
+                dir=self.license_file.parent
+            )
+            
+            try:
+                with os.fdopen(temp_fd, 'wb') as f:
+                    f.write(json_dumps(self.data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                os.replace(temp_path, self.license_file)
+            except Exception:
+                # Clean up temp file on error
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+            
             logger.debug("Saved license data")
         except IOError as e:
             logger.error(f"Failed to save license data: {e}")
@@ -326,10 +409,14 @@ class LicenseManager:
         Returns:
             Datetime of activation or None if not licensed.
         """
+        if self._activated_cache is not None:
+            return self._activated_cache
+        
         activated_at = self.data.get("activated_at")
         if activated_at:
             try:
-                return datetime.fromisoformat(activated_at)
+                self._activated_cache = datetime.fromisoformat(activated_at)
+                return self._activated_cache
             except ValueError:
                 pass
         return None
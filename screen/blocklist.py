@@ -7,20 +7,53 @@ for distraction detection during focus sessions.
 
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Callable, Dict, FrozenSet, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from json_io import json_dumps, json_loads
+
+# pyahocorasick (in requirements.txt) scans a text for all patterns in one
+# pass with a C automaton, about 3x faster than the trie regex. The regex
+# is kept as a fallback for source installs where it fails to build.
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class BlocklistCategory:
+    """
+    A preset group of blocklist patterns the user can toggle as a unit.
+    
+    Patterns are stored as tuples, with a lowercased copy computed once at
+    import for case-insensitive matching.
+    """
+    
+    name: str
+    description: str
+    patterns: Tuple[str, ...]
+    default_enabled: bool = False
+    patterns_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the lowercased patterns."""
+        object.__setattr__(self, "patterns_lower", tuple(p.lower() for p in self.patterns))
+
+
 # Preset blocklist categories
 # Each pattern covers both web URLs and desktop app window titles where applicable
-PRESET_CATEGORIES = {
-    "social_media": {
-        "name": "Social Media",
-        "description": "Social networking sites and apps",
-        "patterns": [
+PRESET_CATEGORIES: Dict[str, BlocklistCategory] = {
+    "social_media": BlocklistCategory(
+        name="Social Media",
+        description="Social networking sites and apps",
+        patterns=(
             # Facebook
             "facebook.com",
             "fb.com",
@@ -47,13 +80,13 @@ PRESET_CATEGORIES = {
             "threads.net",
             # BeReal
             "bereal.com",
-        ],
-        "default_enabled": True,
-    },
-    "video_streaming": {
-        "name": "Video Streaming",
-        "description": "Video and streaming platforms",
-        "patterns": [
+        ),
+        default_enabled=True,
+    ),
+    "video_streaming": BlocklistCategory(
+        name="Video Streaming",
+        description="Video and streaming platforms",
+        patterns=(
             # YouTube
             "youtube.com",
             "youtu.be",
@@ -87,13 +120,13 @@ PRESET_CATEGORIES = {
             "paramountplus.com",
             # Apple TV+
             "tv.apple.com",
-        ],
-        "default_enabled": True,
-    },
-    "gaming": {
-        "name": "Gaming",
-        "description": "Gaming platforms, sites, and apps",
-        "patterns": [
+        ),
+        default_enabled=True,
+    ),
+    "gaming": BlocklistCategory(
+        name="Gaming",
+        description="Gaming platforms, sites, and apps",
+        patterns=(
             # Steam
             "Steam",  # Desktop app
             "steampowered.com",
@@ -134,13 +167,13 @@ PRESET_CATEGORIES = {
             "origin.com",
             "ea.com",
             "EA app",  # Desktop app
-        ],
-        "default_enabled": True,
-    },
-    "messaging": {
-        "name": "Messaging",
-        "description": "Chat and messaging apps (some may be productive)",
-        "patterns": [
+        ),
+        default_enabled=True,
+    ),
+    "messaging": BlocklistCategory(
+        name="Messaging",
+        description="Chat and messaging apps (some may be productive)",
+        patterns=(
             # WhatsApp
             "WhatsApp",  # Desktop app
             "web.whatsapp.com",
@@ -163,13 +196,13 @@ PRESET_CATEGORIES = {
             # Slack (disabled by default - often productive)
             # "slack.com",
             # "Slack",
-        ],
-        "default_enabled": False,  # Off by default - may be productive
-    },
-    "news_entertainment": {
-        "name": "News & Entertainment",
-        "description": "News sites and entertainment portals",
-        "patterns": [
+        ),
+        default_enabled=False,  # Off by default - may be productive
+    ),
+    "news_entertainment": BlocklistCategory(
+        name="News & Entertainment",
+        description="News sites and entertainment portals",
+        patterns=(
             # Entertainment
             "buzzfeed.com",
             "9gag.com",
@@ -187,9 +220,9 @@ PRESET_CATEGORIES = {
             # Celebrity gossip
             "eonline.com",
             "perezhilton.com",
-        ],
-        "default_enabled": False,  # Off by default - news may be needed
-    },
+        ),
+        default_enabled=False,  # Off by default - news may be needed
+    ),
 }
 
 
@@ -205,6 +238,170 @@ QUICK_SITES = {
 }
 
 
+# Lowercased quick site patterns, computed once at import (preset categories
+# carry their own) so building the matcher only lowercases custom entries
+_QUICK_SITE_PATTERNS_LOWER = {
+    site_id: tuple(p.lower() for p in site_data["patterns"])
+    for site_id, site_data in QUICK_SITES.items()
+}
+
+
+# Fields whose contents feed get_all_patterns(); reassigning any of them
+# invalidates the compiled matcher
+_PATTERN_FIELDS = frozenset({
+    "enabled_categories",
+    "enabled_quick_sites",
+    "custom_urls",
+    "custom_apps",
+    "custom_patterns",
+})
+
+# A matcher takes lowercased text and returns the (lowercased) pattern
+# found in it, or None if no pattern matches
+_Matcher = Callable[[str], Optional[str]]
+
+# A bare hostname such as "facebook.com" (no scheme, path or spaces)
+_HOSTNAME_PATTERN = re.compile(r"^[a-z0-9.-]+\.[a-z]{2,}$")
+
+
+def _get_url_host(url: str) -> Optional[str]:
+    """
+    Extract the lowercase hostname from a URL.
+    
+    Args:
+        url: URL to parse
+        
+    Returns:
+        Hostname, or None if the URL has none or can't be parsed
+    """
+    try:
+        return urlsplit(url).hostname
+    except ValueError:
+        return None
+
+
+def _never_match(text: str) -> Optional[str]:
+    """Matcher used when no patterns are active."""
+    return None
+
+
+def _compile_patterns(patterns: List[str]) -> _Matcher:
+    """
+    Compile literal patterns into a single matcher.
+    
+    Uses a pyahocorasick automaton when installed, otherwise a regex.
+    Both report the longest pattern that matches at the leftmost position.
+    
+    Args:
+        patterns: Literal (already lowercased) patterns to match
+        
+    Returns:
+        Matcher for the patterns; matches nothing if patterns is empty
+    """
+    if not patterns:
+        return _never_match
+    if AHOCORASICK_AVAILABLE:
+        return _compile_automaton(patterns)
+    
+    try:
+        search = _compile_trie_regex(patterns).search
+    except (RecursionError, re.error) as e:
+        # The regex parser recurses once per nested group; thousands of
+        # patterns that are prefixes of each other nest too deeply. A flat
+        # alternation (longest first, so the leftmost match is also the
+        # longest) is slower but never nests.
+        logger.warning(f"Blocklist trie regex failed ({e}) - using flat alternation")
+        alternatives = sorted(patterns, key=len, reverse=True)
+        search = re.compile("|".join(map(re.escape, alternatives))).search
+    
+    def match_regex(text: str) -> Optional[str]:
+        match = search(text)
+        return match.group(0) if match else None
+    
+    return match_regex
+
+
+def _compile_automaton(patterns: List[str]) -> _Matcher:
+    """
+    Build an Aho-Corasick automaton over literal patterns.
+    
+    Args:
+        patterns: Non-empty list of literal (already lowercased) patterns
+        
+    Returns:
+        Matcher for the patterns
+    """
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    # iter() yields (end_index, pattern) for every match. Pick the leftmost,
+    # then longest, like the regex fallback (iter_long() skips some matches).
+    iter_matches = automaton.iter
+    
+    def leftmost_longest(item: Tuple[int, str]) -> Tuple[int, int]:
+        end, pattern = item
+        return end - len(pattern), -len(pattern)
+    
+    def match_automaton(text: str) -> Optional[str]:
+        best = min(iter_matches(text), key=leftmost_longest, default=None)
+        return best[1] if best else None
+    
+    return match_automaton
+
+
+def _compile_trie_regex(patterns: List[str]) -> re.Pattern:
+    """
+    Compile literal patterns into a single regex shaped like a prefix trie.
+    
+    A flat "a|b|c" alternation makes the regex engine try every pattern at
+    every text position. Factoring shared prefixes means only branches whose
+    first character matches are explored, so one search() call scans a text
+    for all patterns at once. Greedy matching reports the longest pattern
+    that matches at the leftmost position.
+    
+    Args:
+        patterns: Non-empty list of literal (already lowercased) patterns
+        
+    Returns:
+        Compiled regex
+    """
+    trie: Dict[str, Any] = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = None  # End-of-pattern marker
+    
+    # Convert bottom-up with an explicit stack rather than recursion: the
+    # trie is as deep as the longest pattern, and custom patterns have no
+    # length cap, so recursion could hit the interpreter's limit
+    node_regex: Dict[int, str] = {}
+    stack = [(trie, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            stack.extend((child, False) for char, child in node.items() if char)
+            continue
+        
+        branches = [
+            re.escape(char) + node_regex.pop(id(child))
+            for char, child in node.items()
+            if char
+        ]
+        if not branches:
+            node_regex[id(node)] = ""
+            continue
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # A shorter pattern ends here; the longer continuation is optional
+            body = "(?:" + body + ")?"
+        node_regex[id(node)] = body
+    
+    return re.compile(node_regex[id(trie)])
+
+
 @dataclass
 class Blocklist:
     """
@@ -212,6 +409,11 @@ class Blocklist:
     
     Combines preset categories with custom user additions.
     URLs and app names are stored separately for better validation.
+    
+    Active patterns are compiled into a single matcher on first use. The
+    matcher is rebuilt whenever a pattern field is reassigned or changed
+    through one of the enable/disable/add/remove methods, so mutate the
+    blocklist through those rather than editing the sets/lists in place.
     """
     
     enabled_categories: Set[str] = field(default_factory=set)
@@ -222,13 +424,39 @@ class Blocklist:
     custom_patterns: List[str] = field(default_factory=list)
     # Track patterns that need to be removed (self-cleaning)
     _patterns_to_remove: List[str] = field(default_factory=list, repr=False)
+    # Cached pattern lists and compiled matcher (None = needs rebuild)
+    _patterns_cache: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    _compiled: Optional[_Matcher] = field(default=None, init=False, repr=False, compare=False)
+    # Matcher over URL-style patterns only (built with _compiled)
+    _compiled_url: _Matcher = field(default=_never_match, init=False, repr=False, compare=False)
+    # Hostname patterns for the O(1) URL fast path (built with _compiled)
+    _exact_hosts: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    # Maps a lowercased pattern back to the pattern as the user entered it
+    _pattern_lookup: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Bumped on every invalidation so a rebuild can detect changes made
+    # while it was running (the settings dialog edits the blocklist from
+    # the GUI thread while the screen-detection thread matches)
+    _cache_version: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Invalidate cached patterns when a pattern field is replaced."""
+        if name in _PATTERN_FIELDS:
+            current = getattr(self, name, None)
+            super().__setattr__(name, value)
+            # Re-assigning an equal copy (e.g. saving the settings dialog
+            # without edits) keeps the matcher. The same object may have
+            # been edited in place, so that always invalidates.
+            if value is current or value != current:
+                self._invalidate_cache()
+        else:
+            super().__setattr__(name, value)
     
     def __post_init__(self):
         """Initialize with default enabled categories and quick sites if empty."""
         if not self.enabled_categories:
             self.enabled_categories = {
-                cat_id for cat_id, cat_data in PRESET_CATEGORIES.items()
-                if cat_data.get("default_enabled", False)
+                cat_id for cat_id, category in PRESET_CATEGORIES.items()
+                if category.default_enabled
             }
         
         # Enable all 6 quick sites by default
@@ -245,34 +473,55 @@ class Blocklist:
         
         Heuristic: patterns with dots (.) are URLs, others are app names.
         """
+        # Sets for O(1) duplicate checks - the lists keep the user's order
+        known_urls = set(self.custom_urls)
+        known_apps = set(self.custom_apps)
+        
         for pattern in self.custom_patterns:
             if '.' in pattern and not pattern.startswith(' '):
                 # Looks like a URL/domain
-                if pattern not in self.custom_urls:
+                if pattern not in known_urls:
+                    known_urls.add(pattern)
                     self.custom_urls.append(pattern)
                     logger.info(f"Migrated legacy pattern '{pattern}' to custom_urls")
             else:
                 # Looks like an app name
-                if pattern not in self.custom_apps:
+                if pattern not in known_apps:
+                    known_apps.add(pattern)
                     self.custom_apps.append(pattern)
                     logger.info(f"Migrated legacy pattern '{pattern}' to custom_apps")
         
         # Clear legacy patterns after migration
         self.custom_patterns = []
     
+    def _invalidate_cache(self) -> None:
+        """Drop cached patterns and matcher so the next check rebuilds them."""
+        # Bump first: a rebuild that publishes after this point sees the
+        # new version and discards its result
+        self._cache_version += 1
+        self._patterns_cache = None
+        self._compiled = None
+    
     def get_all_patterns(self) -> List[str]:
         """
         Get all active blocking patterns.
         
+        The list is cached until the blocklist changes; callers must not
+        modify it.
+        
         Returns:
             Combined list of patterns from enabled categories, quick sites, and custom additions.
         """
+        if self._patterns_cache is not None:
+            return self._patterns_cache
+        
+        version = self._cache_version
         patterns = []
         
         # Add patterns from enabled categories
         for cat_id in self.enabled_categories:
             if cat_id in PRESET_CATEGORIES:
-                patterns.extend(PRESET_CATEGORIES[cat_id]["patterns"])
+                patterns.extend(PRESET_CATEGORIES[cat_id].patterns)
         
         # Add patterns from enabled quick sites
         for site_id in self.enabled_quick_sites:
@@ -286,8 +535,64 @@ class Blocklist:
         # Legacy support: also add any remaining custom_patterns
         patterns.extend(self.custom_patterns)
         
+        self._patterns_cache = patterns
+        if self._cache_version != version:
+            # Blocklist changed while building - don't keep a stale list
+            self._patterns_cache = None
         return patterns
     
+    def _collect_patterns_lower(self) -> Tuple[Dict[str, str], Set[str]]:
+        """
+        Collect all active patterns lowercased for case-insensitive matching.
+        
+        Preset patterns come from the pre-lowercased tables; custom patterns
+        that can't be processed are removed from the blocklist
+        (self-cleaning behavior).
+        
+        Returns:
+            Tuple of (dict mapping each lowercased pattern to its original
+            form, set of lowercased patterns that came from custom_urls)
+        """
+        lookup: Dict[str, str] = {}
+        custom_urls_lower: Set[str] = set()
+        patterns_to_remove = []
+        
+        # Preset patterns are pre-lowercased and known to be valid
+        for cat_id in self.enabled_categories:
+            category = PRESET_CATEGORIES.get(cat_id)
+            if category is not None:
+                for pattern, pattern_lower in zip(category.patterns, category.patterns_lower):
+                    lookup.setdefault(pattern_lower, pattern)
+        
+        for site_id in self.enabled_quick_sites:
+            if site_id in QUICK_SITES:
+                for pattern, pattern_lower in zip(
+                    QUICK_SITES[site_id]["patterns"], _QUICK_SITE_PATTERNS_LOWER[site_id]
+                ):
+                    lookup.setdefault(pattern_lower, pattern)
+        
+        custom_url_set = {p for p in self.custom_urls if isinstance(p, str)}
+        for pattern in self.custom_urls + self.custom_apps + self.custom_patterns:
+            try:
+                pattern_lower = pattern.lower()
+            except Exception as e:
+                # Log the error and mark pattern for removal (self-cleaning)
+                logger.error(f"Invalid pattern '{pattern}' caused error: {e} - marking for removal")
+                patterns_to_remove.append(pattern)
+                continue
+            # Skip empty entries (hand-edited settings, legacy migration):
+            # they'd match at every position and mask real matches
+            if pattern_lower:
+                lookup.setdefault(pattern_lower, pattern)
+                if pattern in custom_url_set:
+                    custom_urls_lower.add(pattern_lower)
+        
+        # Auto-clean: remove problematic patterns
+        if patterns_to_remove:
+            self._remove_invalid_patterns(patterns_to_remove)
+        
+        return lookup, custom_urls_lower
+    
     def check_distraction(
         self,
         url: Optional[str] = None,
@@ -308,16 +613,48 @@ class Blocklist:
         Returns:
             Tuple of (is_distracted, matched_pattern)
         """
-        patterns = self.get_all_patterns()
-        patterns_to_remove = []
+        # Nothing to check (e.g. no active window) - skip building the matcher
+        if not (url or window_title or app_name):
+            return False, None
         
-        # Combine all text to check (lowercase for case-insensitive matching)
-        check_texts = []
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._build_matcher()
+        compiled_url = self._compiled_url
+        
+        # Fast path: the URL's host (or a parent domain, e.g. facebook.com
+        # for www.facebook.com) is itself a blocked hostname. Any hit here
+        # is also a substring match, so the full scan below stays the
+        # source of truth for everything else.
+        url_host = _get_url_host(url) if isinstance(url, str) else None
+        if url_host:
+            exact_hosts = self._exact_hosts
+            host = url_host
+            while host:
+                if host in exact_hosts:
+                    pattern = self._pattern_lookup.get(host, host)
+                    logger.debug(f"Distraction detected: '{pattern}' matches host '{url_host}'")
+                    return True, pattern
+                host = host.partition(".")[2]
+        
+        # Lowercase all text for case-insensitive matching.
+        # str.lower() already has an ASCII fast path; str.translate tables and
+        # re.IGNORECASE both measured several times slower here.
         if url:
             try:
-                check_texts.append(url.lower())
+                url_lower = url.lower()
             except Exception as e:
                 logger.warning(f"Error processing URL '{url}': {e}")
+            else:
+                # URLs are only checked against URL-style patterns, so app
+                # names like "Signal" don't match e.g. ".../signal.html"
+                matched = compiled_url(url_lower)
+                if matched:
+                    pattern = self._pattern_lookup.get(matched, matched)
+                    logger.debug(f"Distraction detected: '{pattern}' found in '{url_lower[:50]}'")
+                    return True, pattern
+        
+        check_texts = []
         if window_title:
             try:
                 check_texts.append(window_title.lower())
@@ -329,26 +666,62 @@ class Blocklist:
             except Exception as e:
                 logger.warning(f"Error processing app_name '{app_name}': {e}")
         
-        # Check each pattern against all texts (with error handling)
-        for pattern in patterns:
-            try:
-                pattern_lower = pattern.lower()
-                for text in check_texts:
-                    if pattern_lower in text:
-                        logger.debug(f"Distraction detected: '{pattern}' found in '{text[:50]}'")
-                        return True, pattern
-            except Exception as e:
-                # Log the error and mark pattern for removal (self-cleaning)
-                logger.error(f"Invalid pattern '{pattern}' caused error: {e} - marking for removal")
-                patterns_to_remove.append(pattern)
-                continue  # Move to next pattern
-        
-        # Auto-clean: remove problematic patterns
-        if patterns_to_remove:
-            self._remove_invalid_patterns(patterns_to_remove)
+        # Titles and app names are checked against every pattern: desktop
+        # apps such as "Battle.net" look like domains, and some titles show
+        # the site's domain. Both are scanned in one pass - entries are one
+        # per line, so patterns don't contain newlines and a match can't
+        # straddle the two texts.
+        haystack = "\n".join(check_texts)
+        matched = compiled(haystack)
+        if matched:
+            pattern = self._pattern_lookup.get(matched, matched)
+            logger.debug(f"Distraction detected: '{pattern}' found in '{haystack[:50]}'")
+            return True, pattern
         
         return False, None
     
+    def _build_matcher(self) -> _Matcher:
+        """
+        Compile the active patterns into the matchers used for matching.
+        
+        Custom URLs and other URL-style patterns (containing a dot, the
+        same heuristic used to route legacy custom patterns) also get their
+        own matcher for scanning URLs.
+        
+        Everything is built into locals and then published. If the
+        blocklist changed meanwhile (e.g. a category was disabled from the
+        settings dialog), the result is discarded and rebuilt, so a stale
+        matcher never overwrites the invalidation.
+        
+        Returns:
+            Matcher for any active blocklist entry
+        """
+        while True:
+            version = self._cache_version
+            lookup, custom_urls_lower = self._collect_patterns_lower()
+            patterns_lower = list(lookup)
+            url_patterns = [
+                p for p in patterns_lower if '.' in p or p in custom_urls_lower
+            ]
+            exact_hosts = frozenset(
+                p for p in url_patterns if _HOSTNAME_PATTERN.match(p)
+            )
+            compiled_url = _compile_patterns(url_patterns)
+            compiled = _compile_patterns(patterns_lower)
+            
+            self._pattern_lookup = lookup
+            self._exact_hosts = exact_hosts
+            self._compiled_url = compiled_url
+            # Published last - check_distraction treats it as "ready"
+            self._compiled = compiled
+            
+            # Check after publishing: an invalidation that started before
+            # this check is caught here; one that starts after it clears
+            # _compiled itself
+            if self._cache_version == version:
+                return compiled
+            self._compiled = None
+    
     def _remove_invalid_patterns(self, patterns: List[str]):
         """
         Remove invalid patterns from both custom_urls and custom_apps.
@@ -376,6 +749,7 @@ class Blocklist:
         
         # Mark that patterns were removed (for external save trigger)
         self._patterns_to_remove.extend(patterns)
+        self._invalidate_cache()
     
     def enable_category(self, category_id: str) -> bool:
         """
@@ -388,8 +762,11 @@ class Blocklist:
             True if category was enabled, False if invalid category
         """
         if category_id in PRESET_CATEGORIES:
-            self.enabled_categories.add(category_id)
-            logger.info(f"Enabled blocklist category: {category_id}")
+            # Already enabled: nothing changed, keep the compiled matcher
+            if category_id not in self.enabled_categories:
+                self.enabled_categories.add(category_id)
+                self._invalidate_cache()
+                logger.info(f"Enabled blocklist category: {category_id}")
             return True
         return False
     
@@ -405,6 +782,7 @@ class Blocklist:
         """
         if category_id in self.enabled_categories:
             self.enabled_categories.discard(category_id)
+            self._invalidate_cache()
             logger.info(f"Disabled blocklist category: {category_id}")
             return True
         return False
@@ -420,8 +798,11 @@ class Blocklist:
             True if site was enabled, False if invalid site
         """
         if site_id in QUICK_SITES:
-            self.enabled_quick_sites.add(site_id)
-            logger.info(f"Enabled quick block site: {site_id}")
+            # Already enabled: nothing changed, keep the compiled matcher
+            if site_id not in self.enabled_quick_sites:
+                self.enabled_quick_sites.add(site_id)
+                self._invalidate_cache()
+                logger.info(f"Enabled quick block site: {site_id}")
             return True
         return False
     
@@ -437,6 +818,7 @@ class Blocklist:
         """
         if site_id in self.enabled_quick_sites:
             self.enabled_quick_sites.discard(site_id)
+            self._invalidate_cache()
             logger.info(f"Disabled quick block site: {site_id}")
             return True
         return False
@@ -454,6 +836,7 @@ class Blocklist:
         url = url.strip().lower()
         if url and url not in self.custom_urls:
             self.custom_urls.append(url)
+            self._invalidate_cache()
             logger.info(f"Added custom blocklist URL: {url}")
             return True
         return False
@@ -471,6 +854,7 @@ class Blocklist:
         app_name = app_name.strip()
         if app_name and app_name not in self.custom_apps:
             self.custom_apps.append(app_name)
+            self._invalidate_cache()
             logger.info(f"Added custom blocklist app: {app_name}")
             return True
         return False
@@ -487,6 +871,7 @@ class Blocklist:
         """
         if url in self.custom_urls:
             self.custom_urls.remove(url)
+            self._invalidate_cache()
             logger.info(f"Removed custom blocklist URL: {url}")
             return True
         return False
@@ -503,6 +888,7 @@ class Blocklist:
         """
         if app_name in self.custom_apps:
             self.custom_apps.remove(app_name)
+            self._invalidate_cache()
             logger.info(f"Removed custom blocklist app: {app_name}")
             return True
         return False
@@ -553,6 +939,8 @@ class Blocklist:
             self.custom_patterns.remove(pattern)
             logger.info(f"Removed legacy custom blocklist pattern: {pattern}")
             removed = True
+        if removed:
+            self._invalidate_cache()
         return removed
     
     def to_dict(self) -> Dict[str, Any]:
@@ -618,18 +1006,17 @@ class BlocklistManager:
         if self._blocklist is not None:
             return self._blocklist
         
-        if self.settings_path.exists():
-            try:
-                with open(self.settings_path, "r") as f:
-                    data = json.load(f)
-                self._blocklist = Blocklist.from_dict(data)
-                logger.info(f"Loaded blocklist from {self.settings_path}")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Invalid blocklist file, using defaults: {e}")
-                self._blocklist = Blocklist()
-        else:
+        try:
+            with open(self.settings_path, "rb") as f:
+                data = json_loads(f.read())
+            self._blocklist = Blocklist.from_dict(data)
+            logger.info(f"Loaded blocklist from {self.settings_path}")
+        except FileNotFoundError:
             self._blocklist = Blocklist()
             logger.info("Created default blocklist")
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Invalid blocklist file, using defaults: {e}")
+            self._blocklist = Blocklist()
         
         return self._blocklist
     
@@ -668,8 +1055,8 @@ class BlocklistManager:
             )
             
             try:
-                with os.fdopen(temp_fd, 'w') as f:
-                    json.dump(self._blocklist.to_dict(), f, indent=2)
+                with os.fdopen(temp_fd, 'wb') as f:
+                    f.write(json_dumps(self._blocklist.to_dict()))
                 
                 # Atomic rename (on POSIX systems)
                 # On Windows, this may fail if target exists, so we handle that
@@ -717,10 +1104,10 @@ class BlocklistManager:
         """
         return {
             cat_id: {
-                "name": cat_data["name"],
-                "description": cat_data["description"],
-                "pattern_count": len(cat_data["patterns"]),
-                "default_enabled": cat_data.get("default_enabled", False),
+                "name": category.name,
+                "description": category.description,
+                "pattern_count": len(category.patterns),
+                "default_enabled": category.default_enabled,
             }
-            for cat_id, cat_data in PRESET_CATEGORIES.items()
+            for cat_id, category in PRESET_CATEGORIES.items()
         }
@@ -0,0 +1,277 @@
+"""Unit tests for blocklist distraction matching."""
+
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import screen.blocklist as blocklist_module
+from screen.blocklist import (
+    AHOCORASICK_AVAILABLE,
+    Blocklist,
+    _compile_patterns,
+    _compile_trie_regex,
+)
+
+
+class TestBlocklistMatching(unittest.TestCase):
+    """Test cases for Blocklist.check_distraction."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.blocklist = Blocklist()
+    
+    def test_url_match_returns_pattern(self):
+        """Test that a blocked URL is reported with the matching pattern."""
+        is_distracted, matched = self.blocklist.check_distraction(
+            url="https://www.youtube.com/watch?v=abc"
+        )
+        self.assertTrue(is_distracted)
+        self.assertEqual(matched, "youtube.com")
+    
+    def test_subdomain_url_matches_host_pattern(self):
+        """Test that subdomains of a blocked host are matched."""
+        for url in ("https://m.YouTube.com/", "https://user@www.reddit.com:443/r/python"):
+            is_distracted, matched = self.blocklist.check_distraction(url=url)
+            self.assertTrue(is_distracted, url)
+            self.assertIn(matched, ("youtube.com", "reddit.com"))
+    
+    def test_app_patterns_do_not_match_urls(self):
+        """Test that app-name patterns aren't matched inside URLs."""
+        self.blocklist.enable_category("messaging")
+        
+        is_distracted, _ = self.blocklist.check_distraction(
+            url="https://docs.python.org/3/library/signal.html",
+            app_name="Firefox"
+        )
+        self.assertFalse(is_distracted)
+        
+        # The desktop app itself is still caught
+        self.assertEqual(self.blocklist.check_distraction(app_name="Signal"), (True, "Signal"))
+    
+    def test_custom_url_without_dot_matches_urls(self):
+        """Test that custom URLs match URLs even when they have no dot."""
+        self.blocklist.add_custom_url("localhost")
+        self.assertEqual(
+            self.blocklist.check_distraction(url="http://localhost:8000/"),
+            (True, "localhost")
+        )
+    
+    def test_app_match_is_case_insensitive(self):
+        """Test that app patterns match regardless of case."""
+        is_distracted, matched = self.blocklist.check_distraction(
+            app_name="STEAM"
+        )
+        self.assertTrue(is_distracted)
+        # Original casing of the pattern is preserved
+        self.assertEqual(matched, "Steam")
+    
+    def test_no_match(self):
+        """Test that unrelated content is not flagged."""
+        is_distracted, matched = self.blocklist.check_distraction(
+            url="https://docs.python.org/3/",
+            window_title="Python documentation",
+            app_name="Firefox"
+        )
+        self.assertFalse(is_distracted)
+        self.assertIsNone(matched)
+    
+    def test_no_input(self):
+        """Test that missing inputs are never flagged."""
+        self.assertEqual(self.blocklist.check_distraction(), (False, None))
+    
+    def test_pattern_with_regex_characters(self):
+        """Test that patterns are matched literally, not as regexes."""
+        self.blocklist.add_custom_app("C++ (IDE)")
+        is_distracted, matched = self.blocklist.check_distraction(
+            window_title="main.cpp - C++ (IDE)"
+        )
+        self.assertTrue(is_distracted)
+        self.assertEqual(matched, "C++ (IDE)")
+    
+    def test_add_and_remove_custom_url_updates_matcher(self):
+        """Test that custom URL changes apply to subsequent checks."""
+        url = "https://example.com/page"
+        self.assertFalse(self.blocklist.check_distraction(url=url)[0])
+        
+        self.blocklist.add_custom_url("example.com")
+        self.assertEqual(self.blocklist.check_distraction(url=url), (True, "example.com"))
+        
+        self.blocklist.remove_custom_url("example.com")
+        self.assertFalse(self.blocklist.check_distraction(url=url)[0])
+    
+    def test_category_toggle_updates_matcher(self):
+        """Test that enabling/disabling a category applies immediately."""
+        self.assertFalse(self.blocklist.check_distraction(app_name="Telegram")[0])
+        
+        self.blocklist.enable_category("messaging")
+        self.assertTrue(self.blocklist.check_distraction(app_name="Telegram")[0])
+        
+        self.blocklist.disable_category("messaging")
+        self.assertFalse(self.blocklist.check_distraction(app_name="Telegram")[0])
+    
+    def test_field_reassignment_updates_matcher(self):
+        """Test that replacing custom_apps (as the settings dialog does) applies."""
+        self.assertFalse(self.blocklist.check_distraction(app_name="Solitaire")[0])
+        
+        self.blocklist.custom_apps = ["Solitaire"]
+        self.assertTrue(self.blocklist.check_distraction(app_name="Solitaire")[0])
+    
+    def test_no_op_changes_keep_matcher(self):
+        """Test that unchanged settings don't force a matcher rebuild."""
+        self.blocklist.add_custom_url("example.com")
+        self.blocklist.check_distraction(app_name="Code")
+        compiled = self.blocklist._compiled
+        
+        self.blocklist.enable_category("social_media")  # Already enabled
+        self.blocklist.enable_quick_site("youtube")  # Already enabled
+        self.blocklist.custom_urls = ["example.com"]  # Equal copy
+        self.assertIs(self.blocklist._compiled, compiled)
+    
+    def test_change_during_matcher_build_is_not_lost(self):
+        """Test that a change made while the matcher compiles is applied."""
+        self.blocklist.enable_category("gaming")
+        calls = []
+        
+        def compile_and_disable(patterns):
+            # Simulate the settings dialog disabling a category on the GUI
+            # thread while the detection thread is compiling
+            if not calls:
+                self.blocklist.disable_category("gaming")
+            calls.append(patterns)
+            return _compile_patterns(patterns)
+        
+        with patch.object(blocklist_module, "_compile_patterns", compile_and_disable):
+            result = self.blocklist.check_distraction(app_name="Steam")
+        
+        self.assertNotIn("Steam", self.blocklist.get_all_patterns())
+        self.assertEqual(result, (False, None))
+        self.assertEqual(self.blocklist.check_distraction(app_name="Steam"), (False, None))
+    
+    def test_get_all_patterns_reflects_changes(self):
+        """Test that the cached pattern list is refreshed after changes."""
+        self.assertNotIn("example.com", self.blocklist.get_all_patterns())
+        
+        self.blocklist.add_custom_url("example.com")
+        self.assertIn("example.com", self.blocklist.get_all_patterns())
+        
+        self.blocklist.custom_urls = []
+        self.assertNotIn("example.com", self.blocklist.get_all_patterns())
+    
+    def test_empty_blocklist_matches_nothing(self):
+        """Test that a blocklist with no active patterns never matches."""
+        for cat_id in list(self.blocklist.enabled_categories):
+            self.blocklist.disable_category(cat_id)
+        for site_id in list(self.blocklist.enabled_quick_sites):
+            self.blocklist.disable_quick_site(site_id)
+        
+        is_distracted, matched = self.blocklist.check_distraction(
+            url="https://youtube.com", app_name="Steam"
+        )
+        self.assertFalse(is_distracted)
+        self.assertIsNone(matched)
+    
+    def test_legacy_patterns_migrate_without_duplicates(self):
+        """Test that legacy custom_patterns are split and deduplicated on load."""
+        blocklist = Blocklist.from_dict({
+            "custom_urls": ["a.com"],
+            "custom_patterns": ["a.com", "b.com", "Solitaire", "b.com", "Solitaire"],
+        })
+        self.assertEqual(blocklist.custom_urls, ["a.com", "b.com"])
+        self.assertEqual(blocklist.custom_apps, ["Solitaire"])
+        self.assertEqual(blocklist.custom_patterns, [])
+        self.assertTrue(blocklist.check_distraction(url="https://b.com/")[0])
+    
+    def test_empty_pattern_is_ignored(self):
+        """Test that an empty custom entry doesn't disable matching on either backend."""
+        backends = [False, True] if AHOCORASICK_AVAILABLE else [False]
+        for use_automaton in backends:
+            with self.subTest(automaton=use_automaton), \
+                    patch.object(blocklist_module, "AHOCORASICK_AVAILABLE", use_automaton):
+                blocklist = Blocklist.from_dict({"custom_apps": [""], "custom_urls": [""]})
+                self.assertEqual(
+                    blocklist.check_distraction(window_title="YouTube - steam"),
+                    (True, "Steam")
+                )
+                self.assertEqual(
+                    blocklist.check_distraction(window_title="Python documentation"),
+                    (False, None)
+                )
+    
+    def test_invalid_pattern_is_removed(self):
+        """Test that a non-string pattern is auto-removed instead of crashing."""
+        self.blocklist.custom_apps = [None, "Solitaire"]
+        
+        is_distracted, matched = self.blocklist.check_distraction(app_name="Solitaire")
+        self.assertTrue(is_distracted)
+        self.assertEqual(matched, "Solitaire")
+        self.assertNotIn(None, self.blocklist.custom_apps)
+
+
+
+class TestPatternMatchers(unittest.TestCase):
+    """Test cases for the compiled pattern matchers."""
+    
+    PATTERNS = ["tube", "youtube.com", "you", "reddit.com", "c++ (ide)"]
+    TEXTS = [
+        "www.youtube.com/watch",
+        "youtube",
+        "old.reddit.com - tube",
+        "main.cpp - c++ (ide)",
+        "python documentation\nfirefox",
+        "",
+    ]
+    
+    def test_leftmost_longest_match(self):
+        """Test that the longest pattern at the leftmost position is reported."""
+        match = _compile_patterns(self.PATTERNS)
+        self.assertEqual(match("www.youtube.com/watch"), "youtube.com")
+        self.assertEqual(match("youtube"), "you")
+        self.assertEqual(match("old.reddit.com - tube"), "reddit.com")
+        self.assertIsNone(match("python documentation"))
+    
+    def test_no_patterns_match_nothing(self):
+        """Test that an empty pattern list never matches."""
+        self.assertIsNone(_compile_patterns([])("anything"))
+    
+    def test_very_long_pattern(self):
+        """Test that patterns longer than the recursion limit still compile."""
+        blocklist = Blocklist()
+        long_url = "a" * 2000 + ".com"
+        blocklist.add_custom_url(long_url)
+        self.assertEqual(
+            blocklist.check_distraction(url=f"https://{long_url}/page"),
+            (True, long_url)
+        )
+    
+    def test_deeply_nested_prefixes(self):
+        """Test that the regex fallback handles deeply nested shared prefixes."""
+        patterns = ["a" * length for length in range(1, 1000)] + ["b.com"]
+        with patch.object(blocklist_module, "AHOCORASICK_AVAILABLE", False):
+            match = _compile_patterns(patterns)
+        self.assertEqual(match("x" + "a" * 2000), "a" * 999)
+        self.assertEqual(match("www.b.com"), "b.com")
+    
+    def test_regex_fallback(self):
+        """Test the trie regex used when pyahocorasick isn't installed."""
+        with patch.object(blocklist_module, "AHOCORASICK_AVAILABLE", False):
+            match = _compile_patterns(self.PATTERNS)
+        self.assertEqual(match("www.youtube.com/watch"), "youtube.com")
+        self.assertEqual(match("youtube"), "you")
+        self.assertIsNone(match("python documentation"))
+    
+    @unittest.skipUnless(AHOCORASICK_AVAILABLE, "pyahocorasick not installed")
+    def test_automaton_agrees_with_regex(self):
+        """Test that the Aho-Corasick backend matches the regex fallback."""
+        match = _compile_patterns(self.PATTERNS)
+        regex = _compile_trie_regex(self.PATTERNS)
+        for text in self.TEXTS:
+            expected = regex.search(text)
+            self.assertEqual(match(text), expected.group(0) if expected else None, text)
+
+
+if __name__ == "__main__":
+    unittest.main()
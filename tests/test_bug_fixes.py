@@ -398,6 +398,35 @@ class TestThreadSafeSingletons(unittest.TestCase):
         
         self.assertEqual(len(errors), 0)
         self.assertTrue(len(set(instances)) <= 1)
+    
+    def test_license_manager_singleton_thread_safety(self):
+        """get_license_manager should be thread-safe."""
+        from licensing.license_manager import get_license_manager, reset_license_manager
+        
+        # Reset singleton
+        reset_license_manager()
+        
+        instances = []
+        errors = []
+        
+        def get_instance():
+            try:
+                inst = get_license_manager()
+                instances.append(id(inst))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=get_instance) for _ in range(10)]
+        
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        reset_license_manager()
+        
+        self.assertEqual(len(errors), 0)
+        self.assertEqual(len(set(instances)), 1)
 
 
 class TestVisionProviderValidation(unittest.TestCase):
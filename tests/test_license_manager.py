@@ -0,0 +1,161 @@
+"""Unit tests for license persistence and integrity checks."""
+
+import hashlib
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from licensing.license_manager import LicenseManager
+
+
+class TestLicenseManager(unittest.TestCase):
+    """Test cases for LicenseManager save/load round trips."""
+    
+    def setUp(self):
+        """Set up a license file in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.license_file = Path(self.tmpdir.name) / "license.json"
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmpdir.cleanup()
+    
+    def _write_legacy_license_file(self):
+        """Write an activated license in the format used before checksum_algo."""
+        manager = LicenseManager(self.license_file)
+        manager.activate_with_stripe("cs_test_123")
+        
+        with open(self.license_file) as f:
+            data = json.load(f)
+        # Old format: no marker, SHA256 over the sorted JSON
+        del data["checksum_algo"]
+        del data["checksum"]
+        data["checksum"] = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        with open(self.license_file, "w") as f:
+            json.dump(data, f)
+    
+    def test_missing_file_is_unlicensed(self):
+        """Test that a missing license file loads as unlicensed."""
+        manager = LicenseManager(self.license_file)
+        self.assertFalse(manager.is_licensed())
+    
+    def test_activation_round_trip(self):
+        """Test that an activated license survives a reload."""
+        manager = LicenseManager(self.license_file)
+        manager.activate_with_stripe("cs_test_123", email="user@example.com")
+        
+        reloaded = LicenseManager(self.license_file)
+        self.assertTrue(reloaded.is_licensed())
+        self.assertEqual(reloaded.get_license_info()["email"], "user@example.com")
+    
+    def test_non_ascii_values_are_saved_as_ascii(self):
+        """Test that the file stays ASCII so any locale encoding can read it."""
+        manager = LicenseManager(self.license_file)
+        manager.activate_with_stripe("cs_test_123", email="josé@example.com")
+        
+        self.license_file.read_bytes().decode("ascii")
+        reloaded = LicenseManager(self.license_file)
+        self.assertTrue(reloaded.is_licensed())
+        self.assertEqual(reloaded.get_license_info()["email"], "josé@example.com")
+    
+    def test_data_is_loaded_on_first_access(self):
+        """Test that construction defers reading the license file."""
+        manager = LicenseManager(self.license_file)
+        LicenseManager(self.license_file).activate_with_stripe("cs_test_123")
+        
+        # File was written after construction but before first access
+        self.assertTrue(manager.is_licensed())
+    
+    def test_activation_date_follows_license_changes(self):
+        """Test that the cached activation date is reset on activate/revoke."""
+        manager = LicenseManager(self.license_file)
+        self.assertIsNone(manager.get_activation_date())
+        
+        manager.activate_with_stripe("cs_test_123")
+        activated = manager.get_activation_date()
+        self.assertIsNotNone(activated)
+        self.assertIs(manager.get_activation_date(), activated)
+        
+        manager.revoke_license()
+        self.assertIsNone(manager.get_activation_date())
+    
+    def test_save_leaves_no_temp_files(self):
+        """Test that the atomic save only leaves the license file behind."""
+        manager = LicenseManager(self.license_file)
+        manager.activate_with_stripe("cs_test_123")
+        manager.revoke_license()
+        
+        files = list(Path(self.tmpdir.name).iterdir())
+        self.assertEqual(files, [self.license_file])
+    
+    def test_tampered_file_is_rejected(self):
+        """Test that editing the saved license invalidates it."""
+        manager = LicenseManager(self.license_file)
+        manager.activate_with_promo("cs_test_123", "PROMO")
+        
+        with open(self.license_file) as f:
+            data = json.load(f)
+        data["email"] = "someone-else@example.com"
+        with open(self.license_file, "w") as f:
+            json.dump(data, f)
+        
+        self.assertFalse(LicenseManager(self.license_file).is_licensed())
+    
+    def test_legacy_checksum_without_algo_marker(self):
+        """Test that files saved before the checksum_algo field still verify."""
+        self._write_legacy_license_file()
+        
+        self.assertTrue(LicenseManager(self.license_file).is_licensed())
+    
+    def test_saved_file_verifies_with_original_checksum(self):
+        """Test that new saves stay readable by releases that predate checksum_algo."""
+        manager = LicenseManager(self.license_file)
+        manager.activate_with_stripe("cs_test_123")
+        
+        with open(self.license_file) as f:
+            data = json.load(f)
+        stored_checksum = data.pop("checksum")
+        # Earlier releases hash the sorted JSON of every other key
+        expected = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        self.assertEqual(stored_checksum, expected)
+    
+    def test_resave_after_legacy_load(self):
+        """Test that editing loaded data in place and re-saving keeps it valid."""
+        self._write_legacy_license_file()
+        
+        manager = LicenseManager(self.license_file)
+        manager._calculate_checksum(manager.data)
+        manager.data["email"] = "new@example.com"
+        manager._save_data()
+        
+        reloaded = LicenseManager(self.license_file)
+        self.assertTrue(reloaded.is_licensed())
+        self.assertEqual(reloaded.get_license_info()["email"], "new@example.com")
+    
+    def test_unknown_checksum_algo_is_rejected(self):
+        """Test that an unrecognised checksum algorithm fails verification."""
+        manager = LicenseManager(self.license_file)
+        data = {"licensed": True, "checksum_algo": "md4", "checksum": "0" * 64}
+        self.assertFalse(manager._verify_checksum(data))
+    
+    def test_non_string_checksum_algo_is_rejected(self):
+        """Test that a non-string checksum_algo fails verification instead of raising."""
+        manager = LicenseManager(self.license_file)
+        manager.activate_with_stripe("cs_test_123")
+        
+        with open(self.license_file) as f:
+            data = json.load(f)
+        data["checksum_algo"] = ["sha256"]
+        with open(self.license_file, "w") as f:
+            json.dump(data, f)
+        
+        self.assertFalse(LicenseManager(self.license_file).is_licensed())
+
+
+if __name__ == "__main__":
+    unittest.main()